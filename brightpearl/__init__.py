@@ -1,4 +1,4 @@
-from .client import _BaseClient, BrightpearlAPIError
+from .client import _BaseClient, BrightpearlAPIError, SearchCursor
 from .orders import OrdersMixin
 from .products import ProductsMixin
 
@@ -7,4 +7,4 @@ class BrightpearlAPI(OrdersMixin, ProductsMixin, _BaseClient):
     """Unified client: orders + products (extend by adding more mixins)."""
     pass
 
-__all__ = ["BrightpearlAPI", "BrightpearlAPIError"]
+__all__ = ["BrightpearlAPI", "BrightpearlAPIError", "SearchCursor"]
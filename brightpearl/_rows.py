@@ -0,0 +1,34 @@
+"""Row -> record mapping for Brightpearl search results.
+
+Kept free of optional imports and dynamic attributes so setup.py can
+compile it with mypyc; the pure-Python module is used otherwise.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+
+def rows_to_records(names: List[str], results: List[Any]) -> List[Any]:
+    n_cols = len(names)
+    # Fast path: every row is a list matching the column count, so
+    # dict(zip(...)) can build each record in C.
+    if all(type(row) is list and len(row) == n_cols for row in results):
+        return [dict(zip(names, row)) for row in results]
+
+    # Mixed shapes: fill a pre-sized list rather than growing it by append.
+    records: List[Any] = [None] * len(results)
+    for idx, row in enumerate(results):
+        if isinstance(row, dict):
+            records[idx] = row
+        elif isinstance(row, (list, tuple)):
+            if len(row) <= n_cols:
+                records[idx] = dict(zip(names, row))
+                continue
+            rec: Dict[str, Any] = {}
+            for i, v in enumerate(row):
+                key = names[i] if i < n_cols else f"col_{i}"
+                rec[key] = v
+            records[idx] = rec
+        else:
+            records[idx] = {"value": row}
+    return records
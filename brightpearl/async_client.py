@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, List, Mapping, Optional, TypeVar, Union
+
+import aiohttp
+from urllib3.util.retry import Retry
+
+from .client import (
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    RETRY_STATUSES,
+    BrightpearlAPIError,
+    _SearchResponseMixin,
+    _TokenBucket,
+    _decorrelated_jitter,
+    _dumps,
+    _encode_params,
+    _id_csv_chunks,
+    _int_header,
+    _loads,
+    _normalize_domain,
+    _sort_from_order_by,
+)
+from .orders import _order_search_params
+from .products import DEFAULT_PRODUCT_COLUMNS, _product_search_params
+
+T = TypeVar("T")
+
+
+class AsyncBrightpearlAPI(_SearchResponseMixin):
+    """
+    aiohttp-based client that fetches search pages and bulk lookups concurrently.
+    Mirrors the sync BrightpearlAPI for the read-heavy endpoints.
+    """
+    def __init__(self,domain: str,account_id: str,account_token: str,app_ref: str,*,timeout: int = 30,max_retries: int = 3,backoff_factor: float = 0.5,concurrency: int = 10,rate_limit: Optional[float] = DEFAULT_RATE_LIMIT,rate_burst: int = DEFAULT_RATE_BURST,):
+        self.domain = _normalize_domain(domain)
+        self.account_id = account_id
+        self.base_url = f"{self.domain}/public-api/{self.account_id}"
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.concurrency = concurrency
+        # Same client-side throttle as the sync client; None disables it.
+        self._bucket = _TokenBucket(rate_limit, rate_burst) if rate_limit else None
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "brightpearl-app-ref": app_ref,
+            "brightpearl-account-token": account_token,
+        }
+        # Column spec -> resolved column names (see _column_names)
+        self._colname_cache: Dict[Any, List[str]] = {}
+        self._row_class_cache: Dict[Any, type] = {}
+        # Sessions are bound to the running event loop, so create lazily.
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncBrightpearlAPI":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=20, limit_per_host=10),
+            )
+        return self._session
+
+    def run_sync(self, coro: Awaitable[T]) -> T:
+        """Run a coroutine to completion from sync code, closing the session afterwards."""
+        async def _runner() -> T:
+            try:
+                return await coro
+            finally:
+                await self.close()
+        return asyncio.run(_runner())
+
+    async def _request(self, method: str,path: str,*,params: Optional[Dict[str, Any]] = None,json: Optional[Dict[str, Any]] = None,) -> Dict[str, Any]:
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        session = self._get_session()
+        # yarl rejects None/bool values; encode the way requests would.
+        query = _encode_params(params) if params else None
+
+        data = None
+        if json is not None and _dumps is not None:
+            try:
+                data = _dumps(json)
+            except TypeError:
+                # Leave anything orjson rejects to aiohttp's json=.
+                pass
+
+        attempt = 0
+        delay = 0.0
+        while True:
+            if self._bucket is not None:
+                await self._bucket.acquire_async()
+            if data is not None:
+                request = session.request(method, url, params=query, data=data)
+            else:
+                request = session.request(method, url, params=query, json=json)
+            try:
+                async with request as resp:
+                    status = resp.status
+                    retry_after = resp.headers.get("Retry-After")
+                    body = await resp.read()
+                    if self._bucket is not None:
+                        self._update_bucket(status, resp.headers)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                # Connect/read failures, retried like the sync client's urllib3 Retry.
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                delay = _decorrelated_jitter(self.backoff_factor, delay, Retry.DEFAULT_BACKOFF_MAX)
+                await asyncio.sleep(delay)
+                continue
+
+            # aiohttp has no built-in retry; mirror the sync client's status list
+            if status in RETRY_STATUSES and attempt < self.max_retries:
+                attempt += 1
+                # Jittered so gathered pages that fail together don't retry in lockstep.
+                delay = _decorrelated_jitter(self.backoff_factor, delay, Retry.DEFAULT_BACKOFF_MAX)
+                if retry_after and retry_after.replace(".", "", 1).isdigit():
+                    await asyncio.sleep(float(retry_after))
+                else:
+                    await asyncio.sleep(delay)
+                continue
+            break
+
+        if not (200 <= status < 300):
+            try:
+                payload = _loads(body) if body else {}
+            except ValueError:
+                payload = {"text": body.decode("utf-8", "replace")}
+            raise BrightpearlAPIError(
+                f"Brightpearl API {method} {url} failed with {status}",
+                status=status,
+                payload=payload,
+            )
+
+        try:
+            return _loads(body) if body else {}
+        except ValueError:
+            return {}
+
+    async def _gather(self, coros: Iterable[Awaitable[T]]) -> List[T]:
+        """asyncio.gather that cancels the remaining tasks when one fails."""
+        tasks = [asyncio.ensure_future(c) for c in coros]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            # Let the cancellations finish before the caller closes the session.
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _update_bucket(self, status: int, headers: Mapping[str, str]) -> None:
+        bucket = self._bucket
+        if bucket is None:
+            return
+        if status == 429:
+            bucket.shrink()
+        else:
+            bucket.record_success()
+        remaining = _int_header(headers, "brightpearl-requests-remaining")
+        reset_ms = _int_header(headers, "brightpearl-next-throttle-period")
+        if remaining == 0 and reset_ms:
+            bucket.pause(reset_ms / 1000.0)
+
+    # --- Concurrent pagination over search endpoints ---
+    async def _iter_search_records(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        page_size: int,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        # Page 1 tells us how many results exist; the rest are fetched together.
+        first = await self._request("GET", path, params={**params, "page": 1})
+        response = first.get("response") or {}
+        records = self._normalize_search_response_from_response(response)
+        for rec in records:
+            yield rec
+
+        meta = response.get("metaData") or {}
+        available = meta.get("resultsAvailable")
+        if available is None:
+            # No total reported: page sequentially until a short page, like the sync client.
+            page = 1
+            while len(records) >= page_size:
+                page += 1
+                payload = await self._request("GET", path, params={**params, "page": page})
+                records = self._normalize_search_response(payload)
+                for rec in records:
+                    yield rec
+            return
+
+        last = math.ceil(int(available) / page_size) if page_size else 1
+        if last < 2:
+            return
+
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def _page(page: int) -> Dict[str, Any]:
+            async with sem:
+                return await self._request("GET", path, params={**params, "page": page})
+
+        payloads = await self._gather(_page(p) for p in range(2, last + 1))
+        for payload in payloads:
+            for rec in self._normalize_search_response(payload):
+                yield rec
+
+    def iter_orders_records(
+        self,
+        *,
+        page_size: int = 100,
+        order_by: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        **filters: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        params = _order_search_params(columns, _sort_from_order_by(order_by), page_size, None, None, filters)
+        return self._iter_search_records("order-service/order-search", params, page_size)
+
+    def iter_products_records(
+        self,
+        *,
+        page_size: int = 100,
+        order_by: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        **filters: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        if columns is None:
+            columns = DEFAULT_PRODUCT_COLUMNS
+        params = _product_search_params(columns, _sort_from_order_by(order_by), page_size, None, None, filters)
+        return self._iter_search_records("product-service/product-search", params, page_size)
+
+    # --- ID-based endpoints ---
+    async def get_order(self, order_id: Union[int, str]) -> Dict[str, Any]:
+        return await self._request("GET", f"order-service/order/{order_id}")
+
+    async def _get_bulk(self, path: str, param: str, ids: Iterable[Union[int, str]]) -> Dict[str, Any]:
+        chunks = _id_csv_chunks(ids)
+        if len(chunks) <= 1:
+            return await self._request("GET", path, params={param: chunks[0] if chunks else ""})
+
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def _fetch(csv: str) -> Dict[str, Any]:
+            async with sem:
+                return await self._request("GET", path, params={param: csv})
+
+        payloads = await self._gather(_fetch(c) for c in chunks)
+        merged: List[Any] = []
+        for payload in payloads:
+            merged.extend(payload.get("response") or [])
+        return {"response": merged}
+
+    async def get_orders_bulk(self, order_ids: Iterable[Union[int, str]]) -> Dict[str, Any]:
+        return await self._get_bulk("order-service/order", "orderId", order_ids)
+
+    async def get_product(self, product_id: Union[int, str]) -> Dict[str, Any]:
+        return await self._request("GET", f"product-service/product/{product_id}")
+
+    async def get_products_bulk(self, product_ids: Iterable[Union[int, str]]) -> Dict[str, Any]:
+        return await self._get_bulk("product-service/product", "productId", product_ids)
@@ -1,10 +1,121 @@
 from __future__ import annotations
 
+import asyncio
+import io
+import keyword
+import random
+import ssl
+import sys
+import threading
 import time
-from typing import Any, Dict, Optional, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, make_dataclass
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 import requests
 from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, extract_zipped_paths
 from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
+
+from ._rows import rows_to_records
+
+try:  # optional: orjson decodes/encodes JSON bodies much faster
+    import orjson
+    _loads = orjson.loads
+    # Non-str keys (e.g. {1: ...}) are stringified, as the stdlib json module does.
+    _dumps: Optional[Callable[[Any], bytes]] = partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json as _json
+    _loads = _json.loads
+    _dumps = None  # let the HTTP library serialize json= itself
+
+try:  # optional: ijson parses search pages incrementally (iter_*_records(stream=True))
+    import ijson
+except ImportError:
+    ijson = None
+
+try:  # optional: local HTTP cache for repeated GETs (cache_expire_after=...)
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+try:  # optional: HTTP/2 transport (http2=True)
+    import httpx
+except ImportError:
+    httpx = None
+
+try:  # optional: columnar output (list_*_arrow)
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+# Brightpearl's default quota is 200 requests per minute per account. A full
+# bucket plus a minute of refill must fit in that window: burst + 60 * rate <= 200.
+DEFAULT_RATE_BURST = 10
+DEFAULT_RATE_LIMIT = (200 - DEFAULT_RATE_BURST) / 60.0
+
+# Bulk ID lookups: IDs per request (keeps URLs well under server limits)
+# and how many chunk requests may be in flight at once.
+BULK_CHUNK_SIZE = 200
+BULK_MAX_WORKERS = 8
+
+
+# Statuses retried by both clients (urllib3 Retry / the async retry loop)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _encode_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Encode query params the way requests does, for httpx/aiohttp.
+
+    None values are dropped and everything else is sent as str(); list/tuple
+    values become repeated keys.
+    """
+    out: Dict[str, Any] = {}
+    for k, v in params.items():
+        if v is None:
+            continue
+        if isinstance(v, (list, tuple)):
+            out[k] = [x if isinstance(x, str) else str(x) for x in v if x is not None]
+        else:
+            out[k] = v if isinstance(v, str) else str(v)
+    return out
+
+
+# make_dataclass(slots=True) needs Python 3.10; older versions get regular rows.
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Payload locations _iter_streamed_records builds values for
+_STREAM_TARGETS = frozenset({"response.metaData", "response.columns", "response.results.item"})
+
+
+def _sort_from_order_by(order_by: Optional[str]) -> Optional[str]:
+    # support "updatedOn" or "-updatedOn" style
+    if not order_by:
+        return None
+    return f"{order_by[1:]}:DESC" if order_by.startswith("-") else f"{order_by}:ASC"
+
+
+def _chunked(ids: Iterable[Any], n: int = BULK_CHUNK_SIZE) -> Iterator[List[Any]]:
+    it = iter(ids)
+    return iter(lambda: list(islice(it, n)), [])
+
+
+def _id_csv_chunks(ids: Iterable[Union[int, str]], n: int = BULK_CHUNK_SIZE) -> List[str]:
+    if isinstance(ids, str):
+        # Preformatted "1,2,3": pass it through unless it needs splitting.
+        if ids.count(",") < n:
+            return [ids] if ids else []
+        ids = ids.split(",")
+    return [",".join(map(str, chunk)) for chunk in _chunked(ids, n)]
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    return int(value) if value and value.isdigit() else None
 
 
 class BrightpearlAPIError(Exception):
@@ -15,79 +126,24 @@ class BrightpearlAPIError(Exception):
         self.payload = payload
 
 
-class _BaseClient:
-    """
-    Holds connection details, session, retries, and low-level _request().
-    Feature mixins (orders, products, etc.) subclass this.
-    """
-    def __init__(self,domain: str,account_id: str,account_token: str,app_ref: str,*,timeout: int = 30,max_retries: int = 3,backoff_factor: float = 0.5,):
-        if not domain.startswith("http"):
-            raise ValueError("domain must include scheme, e.g. https://ws-use.brightpearl.com")
-
-        # Optional host normalization (keeps your current inputs working)
-        _raw = domain.strip()
-        aliases = {
-            "use1.brightpearlconnect.com": "https://use1.brightpearlconnect.com",
-            "ws-use.brightpearlconnect.com": "https://ws-use.brightpearlconnect.com",
-        }
-        host = _raw.replace("https://", "").replace("http://", "").strip("/")
-        if host in aliases:
-            _raw = aliases[host]
+def _normalize_domain(domain: str) -> str:
+    if not domain.startswith("http"):
+        raise ValueError("domain must include scheme, e.g. https://ws-use.brightpearl.com")
 
-        self.domain = _raw.rstrip("/")
-        self.account_id = account_id
-        self.base_url = f"{self.domain}/public-api/{self.account_id}"
-        self.timeout = timeout
+    # Optional host normalization (keeps your current inputs working)
+    _raw = domain.strip()
+    aliases = {
+        "use1.brightpearlconnect.com": "https://use1.brightpearlconnect.com",
+        "ws-use.brightpearlconnect.com": "https://ws-use.brightpearlconnect.com",
+    }
+    host = _raw.replace("https://", "").replace("http://", "").strip("/")
+    if host in aliases:
+        _raw = aliases[host]
+    return _raw.rstrip("/")
 
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "brightpearl-app-ref": app_ref,
-            "brightpearl-account-token": account_token,
-        })
-
-        retry = Retry(
-            total=max_retries,
-            read=max_retries,
-            connect=max_retries,
-            status=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=(429, 500, 502, 503, 504),
-            allowed_methods=frozenset({"GET", "POST", "PATCH", "PUT"}),
-            raise_on_status=False,
-        )
-        adapter = HTTPAdapter(max_retries=retry)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
 
-    def _request(self, method: str,path: str,*,params: Optional[Dict[str, Any]] = None,json: Optional[Dict[str, Any]] = None,) -> Dict[str, Any]:
-        url = f"{self.base_url}/{path.lstrip('/')}"
-        resp = self.session.request(method, url, params=params, json=json, timeout=self.timeout)
-
-        if resp.status_code == 429:
-            retry_after = resp.headers.get("Retry-After")
-            if retry_after:
-                try:
-                    time.sleep(float(retry_after))
-                except Exception:
-                    pass
-
-        if not (200 <= resp.status_code < 300):
-            try:
-                payload = resp.json()
-            except Exception:
-                payload = {"text": resp.text}
-            raise BrightpearlAPIError(
-                f"Brightpearl API {method} {url} failed with {resp.status_code}",
-                status=resp.status_code,
-                payload=payload,
-            )
-
-        try:
-            return resp.json()
-        except ValueError:
-            return {}
+class _SearchResponseMixin:
+    """Normalization helpers shared by the sync and async clients."""
 
     # --- Helpers: normalize Brightpearl search responses ---
     def _normalize_search_response(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -102,8 +158,27 @@ class _BaseClient:
 
     def _normalize_search_response_from_response(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
         meta = response.get("metaData") or {}
-        cols = meta.get("columns") or response.get("columns")
+        names = self._column_names(meta.get("columns") or response.get("columns"))
+        return self._rows_to_records(names, response.get("results") or [])
 
+    def _column_names(self, cols: Any) -> List[str]:
+        # Pages of one crawl share a column spec, so resolve each spec once.
+        if isinstance(cols, list):
+            key: Any = tuple(
+                (c.get("name"), c.get("columnName"), c.get("code"), c.get("fieldName"))
+                if isinstance(c, dict) else c
+                for c in cols
+            )
+        elif isinstance(cols, str):
+            key = cols
+        else:
+            return []
+        names = self._colname_cache.get(key)
+        if names is None:
+            names = self._colname_cache[key] = self._build_column_names(cols)
+        return names
+
+    def _build_column_names(self, cols: Any) -> List[str]:
         names: List[str] = []
         if isinstance(cols, list):
             if cols and isinstance(cols[0], dict):
@@ -121,17 +196,530 @@ class _BaseClient:
         elif isinstance(cols, str):
             names = [c.strip() for c in cols.split(",") if c.strip()]
 
+        # Interned keys are shared by every record built from these columns
+        return [sys.intern(n) for n in names]
+
+    def _rows_to_records(self, names: List[str], results: List[Any]) -> List[Dict[str, Any]]:
+        return rows_to_records(names, results)
+
+    def _search_cursor(self, path: str, params_base: Dict[str, Any], page: int, page_size: int, payload: Dict[str, Any]) -> SearchCursor:
+        response = payload.get("response") or {}
+        meta = response.get("metaData") or {}
+        available = meta.get("resultsAvailable")
+        total_pages = -(-int(available) // page_size) if available is not None else None
+        if total_pages is not None:
+            has_more = page < total_pages
+        else:
+            has_more = len(response.get("results") or []) >= page_size
+        return SearchCursor(
+            path=path,
+            params=dict(params_base),
+            page_size=page_size,
+            next_page=page + 1 if has_more else None,
+            total_pages=total_pages,
+        )
+
+    def _search_response_to_rows(self, class_name: str, payload: Dict[str, Any]) -> List[Any]:
+        """Like _normalize_search_response, but returns slotted, frozen dataclass rows.
+
+        Every result row must fit the returned columns; fields missing from a
+        row default to None. Raises ValueError if the column names can't be
+        field names or a row has values outside the columns.
+        """
+        response = payload.get("response") or {}
+        meta = response.get("metaData") or {}
+        names = self._column_names(meta.get("columns") or response.get("columns"))
+        key = (class_name, tuple(names))
+        cls = self._row_class_cache.get(key)
+        if cls is None:
+            bad = [n for n in names if not n.isidentifier() or keyword.iskeyword(n)]
+            if bad or len(set(names)) != len(names):
+                raise ValueError(
+                    f"as_dataclass needs unique, identifier-safe column names; got {names!r}"
+                )
+            cls = self._row_class_cache[key] = make_dataclass(
+                class_name,
+                [(n, Any, field(default=None)) for n in names],
+                frozen=True,
+                **_SLOTS,
+            )
+
         results = response.get("results") or []
-        records: List[Dict[str, Any]] = []
-        for row in results:
-            if isinstance(row, dict):
-                records.append(row)
-            elif isinstance(row, (list, tuple)):
-                rec: Dict[str, Any] = {}
-                for i, v in enumerate(row):
-                    key = names[i] if i < len(names) else f"col_{i}"
-                    rec[key] = v
-                records.append(rec)
+        n_cols = len(names)
+        if all(type(row) is list and len(row) == n_cols for row in results):
+            return [cls(*row) for row in results]
+        fields = set(names)
+        rows: List[Any] = []
+        for idx, rec in enumerate(self._rows_to_records(names, results)):
+            if not fields.issuperset(rec):
+                raise ValueError(f"result row {idx} does not fit columns {names!r}: {results[idx]!r}")
+            rows.append(cls(**rec))
+        return rows
+
+    def _search_response_to_arrow(self, payload: Dict[str, Any]) -> Any:
+        """Convert a Brightpearl search payload into a column-oriented pyarrow.Table."""
+        if pa is None:
+            raise ImportError("Arrow output requires pyarrow (pip install pyarrow)")
+        response = payload.get("response") or {}
+        meta = response.get("metaData") or {}
+        names = self._column_names(meta.get("columns") or response.get("columns"))
+        results = response.get("results") or []
+
+        n_cols = len(names)
+        if all(type(row) is list and len(row) == n_cols for row in results):
+            # Transpose the row arrays into one sequence per column.
+            columns = list(zip(*results)) if results else [()] * n_cols
+            return pa.table({name: pa.array(col) for name, col in zip(names, columns)})
+        return pa.Table.from_pylist(self._rows_to_records(names, results))
+
+    def _iter_streamed_records(self, fp: Any) -> Iterator[Dict[str, Any]]:
+        """Incrementally parse a search payload from a file-like object.
+
+        Rows are yielded as soon as they are parsed. Column names follow the
+        buffered path (metaData.columns, else response.columns), so rows that
+        arrive before those are known are buffered.
+        """
+        names: Optional[List[str]] = None
+        meta_cols: Any = None
+        resp_cols: Any = None
+        meta_seen = False
+        pending: List[Any] = []
+        builder: Any = None
+        target = ""
+        for prefix, event, value in ijson.parse(fp, use_float=True):
+            if builder is None:
+                if prefix not in _STREAM_TARGETS or event in ("end_map", "end_array", "map_key"):
+                    continue
+                if event in ("start_map", "start_array"):
+                    target = prefix
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    continue
+                obj = value  # scalar at a target prefix
+            else:
+                builder.event(event, value)
+                if not (prefix == target and event in ("end_map", "end_array")):
+                    continue
+                obj = builder.value
+                builder = None
+
+            if prefix == "response.results.item":
+                if names is None:
+                    pending.append(obj)
+                else:
+                    yield self._rows_to_records(names, [obj])[0]
+                continue
+            if prefix == "response.metaData":
+                meta_seen = True
+                meta_cols = obj.get("columns") if isinstance(obj, dict) else None
+            else:
+                resp_cols = obj
+            # metaData.columns wins; response.columns only once metaData is known to lack them.
+            if meta_cols:
+                names = self._column_names(meta_cols)
+            elif meta_seen and resp_cols is not None:
+                names = self._column_names(resp_cols)
+            if names is not None and pending:
+                for rec in self._rows_to_records(names, pending):
+                    yield rec
+                pending = []
+        if pending:
+            names = self._column_names(meta_cols or resp_cols)
+            for rec in self._rows_to_records(names, pending):
+                yield rec
+
+
+@dataclass(frozen=True, eq=False)
+class SearchCursor:
+    """Where a paged search left off.
+
+    Returned by list_*_records(return_cursor=True); pass it to
+    iter_*_records(cursor=...) to continue from the next page without
+    refetching the pages already seen. Cursors compare by identity.
+    """
+    path: str                     # search endpoint the cursor belongs to
+    params: Dict[str, Any]        # page-invariant search params (columns, sort, filters)
+    page_size: int
+    next_page: Optional[int]      # None once the last page has been fetched
+    total_pages: Optional[int]    # from metaData.resultsAvailable, when reported
+
+
+def _decorrelated_jitter(base: float, prev: float, cap: float) -> float:
+    """Next retry sleep: uniform(base, prev * 3), capped (prev=0 on the first retry)."""
+    if base <= 0:
+        return 0.0
+    return min(cap, random.uniform(base, (prev or base) * 3))
+
+
+class _JitteredRetry(Retry):
+    """Retry with decorrelated-jitter backoff: sleep = uniform(base, prev * 3), capped.
+
+    Spreads out retries from concurrent clients so they don't re-collide on 429s.
+    """
+    _prev_backoff: float = 0.0
+
+    def new(self, **kw: Any) -> "_JitteredRetry":
+        # urllib3 builds a fresh Retry per attempt; carry the last sleep forward.
+        retry = super().new(**kw)
+        retry._prev_backoff = self._prev_backoff
+        return retry
+
+    def get_backoff_time(self) -> float:
+        if self.backoff_factor <= 0 or not self.history:
+            return 0.0
+        backoff = _decorrelated_jitter(self.backoff_factor, self._prev_backoff, self.backoff_max)
+        self._prev_backoff = backoff
+        return backoff
+
+
+@lru_cache(maxsize=None)
+def _shared_ssl_context() -> ssl.SSLContext:
+    # Built once per process with requests' CA bundle, instead of urllib3
+    # creating a context and re-parsing the bundle for every new connection.
+    ctx = create_urllib3_context()
+    ctx.load_verify_locations(cafile=extract_zipped_paths(DEFAULT_CA_BUNDLE_PATH))
+    return ctx
+
+
+class _SharedContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose verified HTTPS pools share one process-wide SSLContext.
+
+    Only default verification (verify=True, no client cert) uses the shared
+    context; custom CA bundles, verify=False and mTLS keep requests' handling.
+    """
+    def build_connection_pool_key_attributes(self, request: Any, verify: Any, cert: Any = None) -> Any:
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        if verify is True and cert is None and host_params.get("scheme") == "https":
+            pool_kwargs["ssl_context"] = _shared_ssl_context()
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn: Any, url: str, verify: Any, cert: Any) -> None:
+        super().cert_verify(conn, url, verify, cert)
+        if verify is True and cert is None and conn.conn_kw.get("ssl_context") is _shared_ssl_context():
+            # The shared context already holds the CA bundle; don't reload it per connection.
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+class _TokenBucket:
+    """Thread-safe client-side rate limiter with an adaptive refill rate.
+
+    The rate shrinks multiplicatively on each 429 and grows back slowly
+    after a run of successes (never above the configured rate), so the
+    client settles just under the server's real quota.
+    """
+    GROW_AFTER = 20      # consecutive successes before the rate grows
+    MIN_FRACTION = 0.05  # floor for the shrunken rate, as a fraction of max
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = self.max_rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def _reserve(self) -> float:
+        # Reserve a token now (possibly going negative) and return how long to
+        # sleep off the debt, so concurrent callers queue up instead of racing.
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Like acquire(), but yields to the event loop while waiting."""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+    def refund(self) -> None:
+        """Return a token taken by acquire() for a request that never hit the server."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.burst, self._tokens + 1)
+
+    def shrink(self, factor: float = 0.7) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = max(self.max_rate * self.MIN_FRACTION, self.rate * factor)
+            self._tokens = min(self._tokens, 0.0)
+            self._successes = 0
+
+    def grow(self, factor: float = 1.05) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate * factor)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._successes += 1
+            if self._successes < self.GROW_AFTER:
+                return
+            self._successes = 0
+        self.grow()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all callers for ``seconds`` (e.g. until the server window resets)."""
+        with self._lock:
+            self._refill()
+            # Leave the bucket one token short of "seconds" of refill so the
+            # next acquire() waits exactly that long.
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+
+class _BaseClient(_SearchResponseMixin):
+    """
+    Holds connection details, session, retries, and low-level _request().
+    Feature mixins (orders, products, etc.) subclass this.
+    """
+    def __init__(self,domain: str,account_id: str,account_token: str,app_ref: str,*,timeout: int = 30,max_retries: int = 3,backoff_factor: float = 0.5,cache_expire_after: Optional[int] = None,cache_name: str = ".brightpearl_cache",http2: bool = False,rate_limit: Optional[float] = DEFAULT_RATE_LIMIT,rate_burst: int = DEFAULT_RATE_BURST,):
+        self.domain = _normalize_domain(domain)
+        self.account_id = account_id
+        self.base_url = f"{self.domain}/public-api/{self.account_id}"
+        # Precomputed prefix so _request only needs a single concatenation
+        self._base_url = self.base_url.rstrip("/") + "/"
+        self.timeout = timeout
+
+        self.http2 = http2
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "brightpearl-app-ref": app_ref,
+            "brightpearl-account-token": account_token,
+        }
+
+        if http2:
+            # httpx multiplexes concurrent calls over one HTTP/2 connection.
+            # Its transport only retries connection failures, not 429/5xx.
+            if httpx is None:
+                raise ImportError("http2=True requires httpx with HTTP/2 support (pip install 'httpx[http2]')")
+            if cache_expire_after is not None:
+                raise ValueError("cache_expire_after is not supported with http2=True")
+            limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+            self.session = httpx.Client(
+                headers=headers,
+                timeout=timeout,
+                transport=httpx.HTTPTransport(http2=True, limits=limits, retries=max_retries),
+            )
+        else:
+            if cache_expire_after is not None:
+                # Serve repeat GETs (get_order, page-1 polls) from a local SQLite
+                # cache; stale entries are revalidated and used if the API errors.
+                if CachedSession is None:
+                    raise ImportError("cache_expire_after requires requests-cache (pip install requests-cache)")
+                # The credential headers are redacted from the stored requests;
+                # response bodies are still written to disk as-is.
+                self.session = CachedSession(
+                    cache_name=cache_name,
+                    backend="sqlite",
+                    allowable_methods=("GET",),
+                    expire_after=cache_expire_after,
+                    stale_if_error=True,
+                    ignored_parameters=["brightpearl-account-token", "brightpearl-app-ref"],
+                )
+            else:
+                self.session = requests.Session()
+            self.session.headers.update(headers)
+
+            retry = _JitteredRetry(
+                total=max_retries,
+                read=max_retries,
+                connect=max_retries,
+                status=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset({"GET", "POST", "PATCH", "PUT"}),
+                raise_on_status=False,
+            )
+            # Larger pool so threaded callers reuse keep-alive connections
+            # instead of opening (and discarding) overflow ones.
+            adapter = _SharedContextAdapter(max_retries=retry, pool_connections=32, pool_maxsize=32, pool_block=False)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+
+        # Client-side throttle (requests/second); None disables it.
+        self._bucket = _TokenBucket(rate_limit, rate_burst) if rate_limit else None
+
+        # Column spec -> resolved column names (see _column_names)
+        self._colname_cache: Dict[Any, List[str]] = {}
+
+        # (class name, column names) -> dataclass used for as_dataclass=True rows
+        self._row_class_cache: Dict[Any, type] = {}
+
+        # SKU -> (monotonic fetch time, first result) for find_product_by_sku(max_age=...)
+        self._sku_cache: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._sku_lock = threading.Lock()
+
+        # Headers from the most recent response (rate-limit bookkeeping)
+        self._last_headers: Mapping[str, str] = {}
+
+    @property
+    def last_rate_limit(self) -> Dict[str, Optional[int]]:
+        """Brightpearl rate-limit headers from the most recent response.
+
+        ``remaining`` is the number of requests left in the current window and
+        ``next_throttle_period_ms`` the milliseconds until the window resets.
+        Either is None if the server did not send it.
+        """
+        return {
+            "remaining": _int_header(self._last_headers, "brightpearl-requests-remaining"),
+            "next_throttle_period_ms": _int_header(self._last_headers, "brightpearl-next-throttle-period"),
+        }
+
+    def _wait_for_rate_limit(self) -> None:
+        # Sleep out the current window instead of spending a request on a 429.
+        # With the token bucket enabled, _check_response already paused it.
+        if self._bucket is not None:
+            return
+        limit = self.last_rate_limit
+        if limit["remaining"] == 0 and limit["next_throttle_period_ms"]:
+            time.sleep(limit["next_throttle_period_ms"] / 1000.0)
+
+    def _request(self, method: str,path: str,*,params: Optional[Dict[str, Any]] = None,json: Optional[Dict[str, Any]] = None,) -> Dict[str, Any]:
+        url = self._base_url + (path[1:] if path.startswith("/") else path)
+        if self.http2 and params:
+            # httpx sends None as "key=" and bools as "true"; match requests.
+            params = _encode_params(params)
+        if self._bucket is not None:
+            self._bucket.acquire()
+        data = None
+        if json is not None and _dumps is not None:
+            try:
+                data = _dumps(json)
+            except TypeError:
+                # Leave anything orjson rejects to the HTTP library's json=.
+                pass
+        if data is not None:
+            # Pre-serialized body; the session already sends Content-Type: application/json.
+            body = {"content" if self.http2 else "data": data}
+            resp = self.session.request(method, url, params=params, timeout=self.timeout, **body)
+        else:
+            resp = self.session.request(method, url, params=params, json=json, timeout=self.timeout)
+        self._check_response(method, url, resp)
+
+        try:
+            return _loads(resp.content) if resp.content else {}
+        except ValueError:
+            return {}
+
+    def _raw_search(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET a search endpoint with ready-made params (no column/sort/page processing)."""
+        return self._request("GET", path, params=params)
+
+    def _request_stream(self, method: str, path: str, *, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """Like _request, but returns the unread response for incremental parsing."""
+        url = self._base_url + (path[1:] if path.startswith("/") else path)
+        if self._bucket is not None:
+            self._bucket.acquire()
+        resp = self.session.request(method, url, params=params, timeout=self.timeout, stream=True)
+        self._check_response(method, url, resp)
+        return resp
+
+    def _check_response(self, method: str, url: str, resp: requests.Response) -> None:
+        if getattr(resp, "from_cache", False):
+            # requests-cache hit: the server was never contacted, so its
+            # (possibly stale) rate-limit headers must not drive the bucket.
+            if self._bucket is not None:
+                self._bucket.refund()
+        else:
+            self._last_headers = resp.headers
+            if self._bucket is not None:
+                self._update_bucket(resp)
+
+        if resp.status_code == 429:
+            retry_after = resp.headers.get("Retry-After")
+            if retry_after and retry_after.replace(".", "", 1).isdigit():
+                time.sleep(float(retry_after))
+
+        if not (200 <= resp.status_code < 300):
+            try:
+                payload = _loads(resp.content) if resp.content else {}
+            except Exception:
+                payload = {"text": resp.text}
+            raise BrightpearlAPIError(
+                f"Brightpearl API {method} {url} failed with {resp.status_code}",
+                status=resp.status_code,
+                payload=payload,
+            )
+
+    def _get_bulk(self, path: str, param: str, ids: Iterable[Union[int, str]]) -> Dict[str, Any]:
+        """GET an ID-set endpoint in URL-safe chunks, fetched concurrently.
+
+        ``ids`` may be any iterable of IDs or an already formatted "1,2,3" string.
+
+        Chunk responses are merged into a single {"response": [...]} payload.
+        """
+        chunks = _id_csv_chunks(ids)
+        if len(chunks) <= 1:
+            return self._request("GET", path, params={param: chunks[0] if chunks else ""})
+
+        def _fetch(csv: str) -> Dict[str, Any]:
+            return self._request("GET", path, params={param: csv})
+
+        with ThreadPoolExecutor(max_workers=min(BULK_MAX_WORKERS, len(chunks))) as pool:
+            payloads = list(pool.map(_fetch, chunks))
+        merged: List[Any] = []
+        for payload in payloads:
+            merged.extend(payload.get("response") or [])
+        return {"response": merged}
+
+    def _update_bucket(self, resp: requests.Response) -> None:
+        bucket = self._bucket
+        if bucket is None:
+            return
+        # 429s retried inside urllib3 only show up in the Retry history.
+        throttled = 1 if resp.status_code == 429 else 0
+        retries = getattr(getattr(resp, "raw", None), "retries", None)
+        if retries is not None:
+            throttled += sum(1 for h in retries.history if h.status == 429)
+        for _ in range(throttled):
+            bucket.shrink()
+        if not throttled:
+            bucket.record_success()
+
+        limit = self.last_rate_limit
+        if limit["remaining"] == 0 and limit["next_throttle_period_ms"]:
+            bucket.pause(limit["next_throttle_period_ms"] / 1000.0)
+
+    def _stream_search_records(self, path: str, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        # Without ijson (or on the httpx transport), fall back to a buffered
+        # fetch of the whole page.
+        if ijson is None or self.http2:
+            payload = self._request("GET", path, params=params)
+            for rec in self._normalize_search_response(payload):
+                yield rec
+            return
+        count = 0
+        with self._request_stream("GET", path, params=params) as resp:
+            if getattr(resp, "from_cache", False):
+                # requests-cache's replayed raw stream closes itself on ijson's
+                # initial read(0); the body is already in memory anyway.
+                fp: Any = io.BytesIO(resp.content)
+            else:
+                resp.raw.decode_content = True
+                fp = resp.raw
+            try:
+                for rec in self._iter_streamed_records(fp):
+                    count += 1
+                    yield rec
+            except ijson.common.IncompleteJSONError as exc:
+                # The yajl2 backends reject integers beyond 64 bits, which the
+                # buffered parsers accept; refetch the page and skip what was yielded.
+                if "integer overflow" not in str(exc):
+                    raise
             else:
-                records.append({"value": row})
-        return records
+                return
+        payload = self._request("GET", path, params=params)
+        for rec in islice(self._normalize_search_response(payload), count, None):
+            yield rec
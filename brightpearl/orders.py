@@ -1,5 +1,35 @@
 from __future__ import annotations
-from typing import Any, Dict, Iterable, Optional, Union, List, Iterator
+from typing import Any, Dict, Iterable, Optional, Union, List, Iterator, Tuple
+
+from .client import SearchCursor, _sort_from_order_by
+
+
+def _order_search_params(
+    columns: Optional[List[str]],
+    sort: Optional[str],
+    page_size: int,
+    page: Optional[int],
+    first_result: Optional[int],
+    filters: Dict[str, Any],
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"pageSize": page_size}
+    if columns:
+        params["columns"] = ",".join(columns)
+    if sort:
+        # Orders search uses 'orderBy' rather than 'sort'
+        params["orderBy"] = sort
+
+    # Pagination: some deployments expect 'page' param, others 'firstResult'.
+    # Prefer explicit first_result; otherwise use 'page' to avoid 500s observed with firstResult.
+    if first_result is not None:
+        params["firstResult"] = int(first_result)
+    elif page is not None:
+        params["page"] = int(page)
+
+    # Pass through Brightpearl search filters verbatim
+    params.update(filters)
+    return params
+
 
 # Orders mixin lives separate from the base client.
 class OrdersMixin:
@@ -14,27 +44,15 @@ class OrdersMixin:
         first_result: Optional[int] = None,  # alternative to page
         **filters: Any,                      # e.g. updatedOn, orderStatusId, externalRefSearchString, etc.
     ) -> Dict[str, Any]:
-        params: Dict[str, Any] = {"pageSize": page_size}
-        if columns:
-            params["columns"] = ",".join(columns)
-        if sort:
-            # Orders search uses 'orderBy' rather than 'sort'
-            params["orderBy"] = sort
-
-        # Pagination: some deployments expect 'page' param, others 'firstResult'.
-        # Prefer explicit first_result; otherwise use 'page' to avoid 500s observed with firstResult.
-        if first_result is not None:
-            params["firstResult"] = int(first_result)
-        elif page is not None:
-            params["page"] = int(page)
-
-        # Pass through Brightpearl search filters verbatim
-        params.update(filters)
+        params = _order_search_params(columns, sort, page_size, page, first_result, filters)
 
         # Order search on this deployment uses GET with query params
         # (keeps filters/pagination applied correctly across accounts)
         return self._request("GET", "order-service/order-search", params=params)
 
+    def _search_orders_page(self, params_base: Dict[str, Any], page: int) -> Dict[str, Any]:
+        return self._request("GET", "order-service/order-search", params={**params_base, "page": page})
+
     # --- Backwards-friendly list_* that uses search under the hood ---
     def list_orders(
         self,
@@ -48,13 +66,7 @@ class OrdersMixin:
         # Don't force a default projection; some fields vary by account.
         # If provided, keep as-is. If sorting, we don't require the field
         # to be in the projection for orders.
-        sort = None
-        if order_by:
-            # support "updatedOn" or "-updatedOn" style
-            if order_by.startswith("-"):
-                sort = f"{order_by[1:]}:DESC"
-            else:
-                sort = f"{order_by}:ASC"
+        sort = _sort_from_order_by(order_by)
 
         return self.search_orders(
             columns=columns,
@@ -71,8 +83,30 @@ class OrdersMixin:
         page: int = 1,
         order_by: Optional[str] = None,
         columns: Optional[List[str]] = None,
+        as_dataclass: bool = False,          # slotted, frozen OrderSearchRow rows instead of dicts
+        return_cursor: bool = False,         # also return a SearchCursor for iter_orders_records
         **filters: Any,
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[List[Any], Tuple[List[Any], SearchCursor]]:
+        params_base = _order_search_params(columns, _sort_from_order_by(order_by), page_size, None, None, filters)
+        payload = self._search_orders_page(params_base, page)
+        if as_dataclass:
+            records: List[Any] = self._search_response_to_rows("OrderSearchRow", payload)
+        else:
+            records = self._normalize_search_response(payload)
+        if return_cursor:
+            return records, self._search_cursor("order-service/order-search", params_base, page, page_size, payload)
+        return records
+
+    def list_orders_arrow(
+        self,
+        *,
+        page_size: int = 100,
+        page: int = 1,
+        order_by: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        **filters: Any,
+    ) -> Any:
+        """Return one page of results as a pyarrow.Table (requires pyarrow)."""
         payload = self.list_orders(
             page_size=page_size,
             page=page,
@@ -80,7 +114,7 @@ class OrdersMixin:
             columns=columns,
             **filters,
         )
-        return self._normalize_search_response(payload)
+        return self._search_response_to_arrow(payload)
 
     def iter_orders(
         self,
@@ -90,10 +124,11 @@ class OrdersMixin:
         columns: Optional[List[str]] = None,
         **filters: Any,
     ) -> Iterator[Dict[str, Any]]:
+        # Page-invariant params are built once; only "page" changes per request.
+        params_base = _order_search_params(columns, _sort_from_order_by(order_by), page_size, None, None, filters)
         page = 1
         while True:
-            payload = self.list_orders(page_size=page_size, page=page,
-                                       order_by=order_by, columns=columns, **filters)
+            payload = self._search_orders_page(params_base, page)
             response = payload.get("response") or {}
             results = response.get("results") or []
             if not results:
@@ -102,41 +137,57 @@ class OrdersMixin:
             if len(results) < page_size:
                 break
             page += 1
+            self._wait_for_rate_limit()
 
     def iter_orders_records(
         self,
         *,
-        page_size: int = 100,
+        page_size: Optional[int] = None,     # default 100; taken from the cursor when resuming
         order_by: Optional[str] = None,
         columns: Optional[List[str]] = None,
+        stream: bool = False,                # parse each page incrementally (needs ijson)
+        cursor: Optional[SearchCursor] = None,  # resume after list_orders_records(return_cursor=True)
         **filters: Any,
     ) -> Iterator[Dict[str, Any]]:
-        page = 1
+        if cursor is not None:
+            if columns is not None or order_by is not None or filters:
+                raise ValueError("cursor already carries the search parameters; don't pass them again")
+            if cursor.path != "order-service/order-search":
+                raise ValueError(f"cursor is for {cursor.path}, not order-service/order-search")
+            if page_size is not None and page_size != cursor.page_size:
+                raise ValueError(f"cursor pages by {cursor.page_size}; page_size={page_size} would skip or repeat rows")
+            if cursor.next_page is None:
+                return
+            params_base, page_size, page = cursor.params, cursor.page_size, cursor.next_page
+        else:
+            if page_size is None:
+                page_size = 100
+            params_base = _order_search_params(columns, _sort_from_order_by(order_by), page_size, None, None, filters)
+            page = 1
         while True:
-            payload = self.list_orders(
-                page_size=page_size,
-                page=page,
-                order_by=order_by,
-                columns=columns,
-                **filters,
-            )
-            response = payload.get("response") or {}
-            records = self._normalize_search_response_from_response(response)
-            if not records:
-                break
-            for rec in records:
-                yield rec
-            if len(records) < page_size:
+            if stream:
+                count = 0
+                for rec in self._stream_search_records("order-service/order-search", {**params_base, "page": page}):
+                    count += 1
+                    yield rec
+            else:
+                payload = self._search_orders_page(params_base, page)
+                response = payload.get("response") or {}
+                records = self._normalize_search_response_from_response(response)
+                count = len(records)
+                for rec in records:
+                    yield rec
+            if count < page_size:
                 break
             page += 1
+            self._wait_for_rate_limit()
 
     # --- Other order endpoints that still require IDs ---
     def get_order(self, order_id: Union[int, str]) -> Dict[str, Any]:
         return self._request("GET", f"order-service/order/{order_id}")
 
     def get_orders_bulk(self, order_ids: Iterable[Union[int, str]]) -> Dict[str, Any]:
-        ids = ",".join(str(i) for i in order_ids)
-        return self._request("GET", "order-service/order", params={"orderId": ids})
+        return self._get_bulk("order-service/order", "orderId", order_ids)
 
     def create_order(self, order_payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._request("POST", "order-service/order", json=order_payload)
@@ -1,5 +1,40 @@
 from __future__ import annotations
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+import copy
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .client import SearchCursor, _sort_from_order_by
+
+DEFAULT_PRODUCT_COLUMNS = ["productId", "SKU", "productName", "brandId", "productTypeId", "updatedOn"]
+
+# find_product_by_sku: fixed projection and how many recent lookups to remember
+SKU_LOOKUP_COLUMNS = "productId,SKU,productName"
+SKU_CACHE_SIZE = 1024
+
+
+def _product_search_params(
+    columns: Optional[List[str]],
+    sort: Optional[str],
+    page_size: int,
+    page: Optional[int],
+    first_result: Optional[int],
+    filters: Dict[str, Any],
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"pageSize": page_size}
+    if columns:
+        params["columns"] = ",".join(columns)
+    if sort:
+        params["sort"] = sort
+
+    # Pagination: mirror orders behavior for compatibility across accounts
+    if first_result is not None:
+        params["firstResult"] = int(first_result)
+    elif page is not None:
+        params["page"] = int(page)
+
+    params.update(filters)
+    return params
+
 
 class ProductsMixin:
     # --- Low-level search wrapper (Product Search) ---
@@ -13,23 +48,14 @@ class ProductsMixin:
         first_result: Optional[int] = None,
         **filters: Any,                      # e.g. SKU="...", productName="...", brandId=..., updatedOn=...
     ) -> Dict[str, Any]:
-        params: Dict[str, Any] = {"pageSize": page_size}
-        if columns:
-            params["columns"] = ",".join(columns)
-        if sort:
-            params["sort"] = sort
-
-        # Pagination: mirror orders behavior for compatibility across accounts
-        if first_result is not None:
-            params["firstResult"] = int(first_result)
-        elif page is not None:
-            params["page"] = int(page)
-
-        params.update(filters)
+        params = _product_search_params(columns, sort, page_size, page, first_result, filters)
         # Product search on this deployment expects GET with query params
         # (JSON bodies on GET are ignored, which led to unfiltered results).
         return self._request("GET", "product-service/product-search", params=params)
 
+    def _search_products_page(self, params_base: Dict[str, Any], page: int) -> Dict[str, Any]:
+        return self._request("GET", "product-service/product-search", params={**params_base, "page": page})
+
     # --- Backwards-friendly list_* that uses search under the hood ---
     def list_products(
         self,
@@ -41,10 +67,8 @@ class ProductsMixin:
         **filters: Any,
     ) -> Dict[str, Any]:
         if columns is None:
-            columns = ["productId", "SKU", "productName", "brandId", "productTypeId", "updatedOn"]
-        sort = None
-        if order_by:
-            sort = f"{order_by[1:]}:DESC" if order_by.startswith("-") else f"{order_by}:ASC"
+            columns = DEFAULT_PRODUCT_COLUMNS
+        sort = _sort_from_order_by(order_by)
 
         return self.search_products(
             columns=columns,
@@ -55,6 +79,29 @@ class ProductsMixin:
         )
 
     def list_products_records(
+        self,
+        *,
+        page_size: int = 100,
+        page: int = 1,
+        order_by: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        as_dataclass: bool = False,          # slotted, frozen ProductSearchRow rows instead of dicts
+        return_cursor: bool = False,         # also return a SearchCursor for iter_products_records
+        **filters: Any,
+    ) -> Union[List[Any], Tuple[List[Any], SearchCursor]]:
+        if columns is None:
+            columns = DEFAULT_PRODUCT_COLUMNS
+        params_base = _product_search_params(columns, _sort_from_order_by(order_by), page_size, None, None, filters)
+        payload = self._search_products_page(params_base, page)
+        if as_dataclass:
+            records: List[Any] = self._search_response_to_rows("ProductSearchRow", payload)
+        else:
+            records = self._normalize_search_response(payload)
+        if return_cursor:
+            return records, self._search_cursor("product-service/product-search", params_base, page, page_size, payload)
+        return records
+
+    def list_products_arrow(
         self,
         *,
         page_size: int = 100,
@@ -62,7 +109,8 @@ class ProductsMixin:
         order_by: Optional[str] = None,
         columns: Optional[List[str]] = None,
         **filters: Any,
-    ) -> List[Dict[str, Any]]:
+    ) -> Any:
+        """Return one page of results as a pyarrow.Table (requires pyarrow)."""
         payload = self.list_products(
             page_size=page_size,
             page=page,
@@ -70,7 +118,7 @@ class ProductsMixin:
             columns=columns,
             **filters,
         )
-        return self._normalize_search_response(payload)
+        return self._search_response_to_arrow(payload)
 
     def iter_products(
         self,
@@ -80,10 +128,13 @@ class ProductsMixin:
         columns: Optional[List[str]] = None,
         **filters: Any,
     ) -> Iterator[Dict[str, Any]]:
+        if columns is None:
+            columns = DEFAULT_PRODUCT_COLUMNS
+        # Page-invariant params are built once; only "page" changes per request.
+        params_base = _product_search_params(columns, _sort_from_order_by(order_by), page_size, None, None, filters)
         page = 1
         while True:
-            payload = self.list_products(page_size=page_size, page=page,
-                                         order_by=order_by, columns=columns, **filters)
+            payload = self._search_products_page(params_base, page)
             response = payload.get("response") or {}
             results = response.get("results") or []
             if not results:
@@ -92,41 +143,59 @@ class ProductsMixin:
             if len(results) < page_size:
                 break
             page += 1
+            self._wait_for_rate_limit()
 
     def iter_products_records(
         self,
         *,
-        page_size: int = 100,
+        page_size: Optional[int] = None,     # default 100; taken from the cursor when resuming
         order_by: Optional[str] = None,
         columns: Optional[List[str]] = None,
+        stream: bool = False,                # parse each page incrementally (needs ijson)
+        cursor: Optional[SearchCursor] = None,  # resume after list_products_records(return_cursor=True)
         **filters: Any,
     ) -> Iterator[Dict[str, Any]]:
-        page = 1
+        if cursor is not None:
+            if columns is not None or order_by is not None or filters:
+                raise ValueError("cursor already carries the search parameters; don't pass them again")
+            if cursor.path != "product-service/product-search":
+                raise ValueError(f"cursor is for {cursor.path}, not product-service/product-search")
+            if page_size is not None and page_size != cursor.page_size:
+                raise ValueError(f"cursor pages by {cursor.page_size}; page_size={page_size} would skip or repeat rows")
+            if cursor.next_page is None:
+                return
+            params_base, page_size, page = cursor.params, cursor.page_size, cursor.next_page
+        else:
+            if page_size is None:
+                page_size = 100
+            if columns is None:
+                columns = DEFAULT_PRODUCT_COLUMNS
+            params_base = _product_search_params(columns, _sort_from_order_by(order_by), page_size, None, None, filters)
+            page = 1
         while True:
-            payload = self.list_products(
-                page_size=page_size,
-                page=page,
-                order_by=order_by,
-                columns=columns,
-                **filters,
-            )
-            response = payload.get("response") or {}
-            records = self._normalize_search_response_from_response(response)
-            if not records:
-                break
-            for rec in records:
-                yield rec
-            if len(records) < page_size:
+            if stream:
+                count = 0
+                for rec in self._stream_search_records("product-service/product-search", {**params_base, "page": page}):
+                    count += 1
+                    yield rec
+            else:
+                payload = self._search_products_page(params_base, page)
+                response = payload.get("response") or {}
+                records = self._normalize_search_response_from_response(response)
+                count = len(records)
+                for rec in records:
+                    yield rec
+            if count < page_size:
                 break
             page += 1
+            self._wait_for_rate_limit()
 
     # --- ID-based / helper endpoints ---
     def get_product(self, product_id: Union[int, str]) -> Dict[str, Any]:
         return self._request("GET", f"product-service/product/{product_id}")
 
     def get_products_bulk(self, product_ids: Iterable[Union[int, str]]) -> Dict[str, Any]:
-        ids = ",".join(str(i) for i in product_ids)
-        return self._request("GET", "product-service/product", params={"productId": ids})
+        return self._get_bulk("product-service/product", "productId", product_ids)
 
     def create_product(self, product_payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._request("POST", "product-service/product", json=product_payload)
@@ -137,12 +206,30 @@ class ProductsMixin:
     def replace_product(self, product_id: Union[int, str], product_payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._request("PUT", f"product-service/product/{product_id}", json=product_payload)
 
-    def find_product_by_sku(self, sku: str) -> Optional[Dict[str, Any]]:
-        payload = self.search_products(columns=["productId", "SKU", "productName"],
-                                       page_size=1, page=1, SKU=sku)
-        resp = payload.get("response") or {}
-        results = resp.get("results") or []
-        return results[0] if results else None
+    def find_product_by_sku(self, sku: str, *, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        # max_age (seconds): reuse a lookup of the same SKU made within that window.
+        # Cached rows are copied in and out so callers can't mutate them.
+        if max_age is not None:
+            with self._sku_lock:
+                hit = self._sku_cache.get(sku)
+            if hit is not None and time.monotonic() - hit[0] < max_age:
+                return copy.deepcopy(hit[1])
+
+        # Preassembled params: skips search_products' column join and page handling.
+        payload = self._raw_search(
+            "product-service/product-search",
+            {"pageSize": 1, "columns": SKU_LOOKUP_COLUMNS, "page": 1, "SKU": sku},
+        )
+        results = (payload.get("response") or {}).get("results")
+        product = results[0] if results else None
+
+        entry = (time.monotonic(), copy.deepcopy(product))
+        with self._sku_lock:
+            self._sku_cache[sku] = entry
+            self._sku_cache.move_to_end(sku)
+            if len(self._sku_cache) > SKU_CACHE_SIZE:
+                self._sku_cache.popitem(last=False)
+        return product
 
     def get_product_availability(
         self,
@@ -0,0 +1,32 @@
+from setuptools import setup
+
+# The search-row mapper is compiled with mypyc when it is installed
+# (pip install mypy); otherwise the pure-Python module is used as-is.
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    ext_modules = []
+else:
+    # Only _rows.py is compiled; imported modules are not type-checked.
+    ext_modules = mypycify(["--follow-imports=silent", "brightpearl/_rows.py"])
+
+# Optional features, e.g. pip install "BrightPy[async,stream]"
+extras_require = {
+    "async": ["aiohttp"],
+    "http2": ["httpx[http2]"],
+    "cache": ["requests-cache"],
+    "stream": ["ijson"],
+    "arrow": ["pyarrow"],
+    "speedups": ["orjson"],
+}
+extras_require["all"] = sorted({dep for deps in extras_require.values() for dep in deps})
+
+setup(
+    name="BrightPy",
+    version="0.1.0",
+    description="Python client for the Brightpearl API (orders + products).",
+    packages=["brightpearl"],
+    install_requires=["requests", "urllib3"],
+    extras_require=extras_require,
+    ext_modules=ext_modules,
+)
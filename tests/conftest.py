@@ -0,0 +1,45 @@
+import io
+import json
+
+import pytest
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from brightpearl import BrightpearlAPI
+
+
+class FakeAdapter(HTTPAdapter):
+    """Answers requests with ``handler(request)`` instead of going to the network.
+
+    The handler returns a JSON-serializable body, or raw bytes to send as-is.
+    """
+
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        body = self.handler(request)
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers={"Content-Type": "application/json"},
+            status=200,
+            preload_content=False,
+            request_url=request.url,
+        )
+        return self.build_response(request, raw)
+
+
+@pytest.fixture
+def make_api():
+    def make(handler, **kwargs):
+        kwargs.setdefault("rate_limit", None)
+        api = BrightpearlAPI("https://use1.brightpearlconnect.com", "acct", "token", "app", **kwargs)
+        adapter = FakeAdapter(handler)
+        api.session.mount("https://", adapter)
+        return api, adapter
+    return make
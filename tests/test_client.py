@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+
+def _echo(request):
+    return {"response": json.loads(request.body)}
+
+
+def test_create_order_with_int_keys(make_api):
+    api, _ = make_api(_echo)
+    payload = {"rows": {1: {"quantity": 2}, 2: {"quantity": 1}}}
+    sent = api.create_order(payload)["response"]
+    assert sent == json.loads(json.dumps(payload))
+    assert sent == {"rows": {"1": {"quantity": 2}, "2": {"quantity": 1}}}
+
+
+@pytest.mark.skipif(requests_cache is None, reason="requires requests-cache")
+def test_streamed_search_from_cache(make_api, tmp_path):
+    page = {"response": {"metaData": {"columns": ["orderId"]}, "results": [[1], [2]]}}
+    api, adapter = make_api(lambda request: page, cache_expire_after=60, cache_name=str(tmp_path / "cache"))
+    first = list(api.iter_orders_records(stream=True))
+    second = list(api.iter_orders_records(stream=True))
+    assert first == second == [{"orderId": 1}, {"orderId": 2}]
+    assert len(adapter.requests) == 1
+
+
+def test_find_product_by_sku_cache_returns_copies(make_api):
+    api, adapter = make_api(lambda request: {"response": {"results": [[7, "ABC", "Widget"]]}})
+    first = api.find_product_by_sku("ABC", max_age=60)
+    first.append("mutated")
+    second = api.find_product_by_sku("ABC", max_age=60)
+    second[2] = "changed"
+    assert api.find_product_by_sku("ABC", max_age=60) == [7, "ABC", "Widget"]
+    assert len(adapter.requests) == 1
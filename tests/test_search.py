@@ -0,0 +1,98 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+COLUMNS = [{"name": "orderId"}, {"name": "ref"}]
+
+STREAM_PAYLOADS = {
+    "metadata_first": {"response": {"metaData": {"columns": COLUMNS}, "results": [[1, "a"], [2, "b"]]}},
+    "metadata_last": {"response": {"results": [[1, "a"], [2, "b"]], "metaData": {"columns": COLUMNS}}},
+    "response_columns_only": {"response": {"columns": ["orderId", "ref"], "results": [[1, "a"]]}},
+    "response_columns_string": {"response": {"results": [[1, "a"]], "columns": "orderId,ref"}},
+    "metadata_without_columns": {"response": {"results": [[1, "a"]], "metaData": {"resultsAvailable": 1}, "columns": ["orderId", "ref"]}},
+    "metadata_columns_win": {"response": {"columns": "x,y", "results": [[1, "a"]], "metaData": {"columns": COLUMNS}}},
+    "no_columns": {"response": {"metaData": None, "results": [[1, "a"]]}},
+    "ragged_rows": {"response": {"metaData": {"columns": COLUMNS}, "results": [[1, "a", "extra"], [2], []]}},
+    "dict_and_scalar_rows": {"response": {"metaData": {"columns": COLUMNS}, "results": [{"orderId": 1}, 7, "s", None]}},
+    "nested_values": {"response": {"metaData": {"columns": COLUMNS}, "results": [[1, {"lines": [{"sku": "A", "qty": 1.5}, None]}], [2, [[1], []]]]}},
+    "empty": {"response": {"metaData": {"columns": COLUMNS}, "results": []}},
+}
+
+
+@pytest.mark.parametrize("payload", STREAM_PAYLOADS.values(), ids=STREAM_PAYLOADS.keys())
+def test_streamed_records_match_buffered(make_api, payload):
+    api, _ = make_api(lambda request: payload)
+    assert list(api.iter_orders_records(stream=True)) == api.list_orders_records()
+
+
+def test_streamed_records_with_huge_integers(make_api):
+    payload = {"response": {"metaData": {"columns": COLUMNS}, "results": [[1, "a"], [2 ** 70, "b"]]}}
+    api, adapter = make_api(lambda request: payload)
+    streamed = list(api.iter_orders_records(stream=True))
+    assert streamed == api.list_orders_records()
+    assert [rec["ref"] for rec in streamed] == ["a", "b"]
+
+
+def _paged(total, report_total=True):
+    """Search handler serving ``total`` orderId rows, paged by the request's pageSize/page."""
+    def handler(request):
+        query = parse_qs(urlparse(request.url).query)
+        page_size, page = int(query["pageSize"][0]), int(query["page"][0])
+        start = (page - 1) * page_size
+        meta = {"columns": ["orderId"]}
+        if report_total:
+            meta["resultsAvailable"] = total
+        return {"response": {"metaData": meta, "results": [[i] for i in range(start, min(total, start + page_size))]}}
+    return handler
+
+
+@pytest.mark.parametrize("report_total", [True, False])
+def test_cursor_resumes_after_first_page(make_api, report_total):
+    api, adapter = make_api(_paged(250, report_total))
+    first, cursor = api.list_orders_records(page_size=100, return_cursor=True)
+    assert cursor.path == "order-service/order-search"
+    assert cursor.next_page == 2
+    assert cursor.total_pages == (3 if report_total else None)
+    assert {cursor} == {cursor}
+    rest = list(api.iter_orders_records(cursor=cursor))
+    assert [rec["orderId"] for rec in first + rest] == list(range(250))
+    assert len(adapter.requests) == 3
+
+
+@pytest.mark.parametrize("total, report_total", [(250, True), (200, True), (250, False)])
+def test_cursor_on_last_page(make_api, total, report_total):
+    api, adapter = make_api(_paged(total, report_total))
+    _, cursor = api.list_orders_records(page_size=100, page=3, return_cursor=True)
+    assert cursor.next_page is None
+    assert list(api.iter_orders_records(cursor=cursor)) == []
+    assert len(adapter.requests) == 1
+
+
+def test_cursor_exact_multiple_without_total(make_api):
+    # Without resultsAvailable a full page always looks like there may be more.
+    api, _ = make_api(_paged(200, report_total=False))
+    _, cursor = api.list_orders_records(page_size=100, page=2, return_cursor=True)
+    assert cursor.next_page == 3
+    assert list(api.iter_orders_records(cursor=cursor)) == []
+
+
+def test_cursor_rejects_other_endpoint(make_api):
+    api, _ = make_api(_paged(250))
+    _, cursor = api.list_orders_records(page_size=100, return_cursor=True)
+    with pytest.raises(ValueError, match="cursor is for order-service/order-search"):
+        list(api.iter_products_records(cursor=cursor))
+
+
+def test_cursor_rejects_other_page_size(make_api):
+    api, _ = make_api(_paged(250))
+    _, cursor = api.list_orders_records(page_size=100, return_cursor=True)
+    with pytest.raises(ValueError, match="cursor pages by 100"):
+        list(api.iter_orders_records(cursor=cursor, page_size=50))
+    assert len(list(api.iter_orders_records(cursor=cursor, page_size=100))) == 150
+
+
+def test_cursor_rejects_search_params(make_api):
+    api, _ = make_api(_paged(250))
+    _, cursor = api.list_orders_records(page_size=100, return_cursor=True)
+    with pytest.raises(ValueError, match="already carries"):
+        list(api.iter_orders_records(cursor=cursor, order_by="orderId"))